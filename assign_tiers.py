@@ -13,6 +13,9 @@ Tier definitions:
 
 Setup:
     pip install anthropic           # Only needed for Claude API fallback
+    pip install rapidfuzz           # Optional: much faster fuzzy matching
+    pip install pyahocorasick       # Optional: single-pass substring matching
+    pip install orjson              # Optional: faster conferences.json load/save
     set ANTHROPIC_API_KEY=sk-...    # Your API key (Windows)
     export ANTHROPIC_API_KEY=sk-... # Your API key (Mac/Linux)
 
@@ -20,28 +23,74 @@ Usage:
     python assign_tiers.py                  # Assign tiers to all untiered conferences
     python assign_tiers.py --all            # Re-assign ALL tiers (overwrites existing)
     python assign_tiers.py --no-api         # Reference dict only, skip Claude API
+    python assign_tiers.py --batch-api      # Use the Message Batches API (half price, slower)
     python assign_tiers.py --dry-run        # Preview changes without saving
 """
 
-import json, re, os, sys, argparse, logging
+import json, re, os, sys, time, argparse, asyncio, logging, sqlite3
 from pathlib import Path
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None  # Fall back to difflib.SequenceMatcher
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to scanning the pattern list
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # rapidfuzz's cdist needs numpy; match names one at a time instead
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
 # --- Configuration ---
 JSON_PATH = Path("conferences.json")
 LOG_PATH = Path("tier_log.txt")
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s  %(message)s",
-    datefmt="%H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_PATH, mode="w", encoding="utf-8"),
-    ],
-)
+# Conference counts above which pure-Python fuzzy matching is spread over processes
+PARALLEL_MIN_NAMES = 500
+
+# Claude API: batches in flight at once, and the account limits we pace against
+API_CONCURRENCY = 8
+API_REQUESTS_PER_MIN = 40
+API_INPUT_TOKENS_PER_MIN = 16000
+BATCH_POLL_SECONDS = 20
+BATCH_MAX_WAIT_HOURS = 24  # Batches normally end well within this; a stuck one is cancelled
+
+# API verdicts are cached by normalized name so reruns only pay for new names
+CACHE_PATH = Path("tier_cache.sqlite")
+CACHE_TTL_DAYS = 180
+
 log = logging.getLogger(__name__)
 
+
+def setup_logging():
+    # Called from main() rather than at import, so worker processes that re-import
+    # this module (spawn/forkserver) don't truncate the log file
+    # Per-conference lines are DEBUG: they go to the log file but not the console
+    console = logging.StreamHandler()
+    console.setLevel(logging.INFO)
+    logfile = logging.FileHandler(LOG_PATH, mode="w", encoding="utf-8")
+    logfile.setLevel(logging.DEBUG)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s  %(message)s",
+        datefmt="%H:%M:%S",
+        handlers=[console, logfile],
+    )
+    log.setLevel(logging.DEBUG)
+
 # ─────────────────────────────────────────────────────────────────────────────
 # TIER REFERENCE DICTIONARY
 # ─────────────────────────────────────────────────────────────────────────────
@@ -378,69 +427,236 @@ TIER_REFERENCE = [
 # FUZZY MATCHING
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Years, ordinals (1st, 2nd, 3rd, 4th, ...) and standalone numbers, in one pass
+_RE_NUMBERS = re.compile(r'\b\d+(?:st|nd|rd|th)?\b')
+_RE_DIGIT = re.compile(r'\d')
+_CFP_PREFIXES = ("call for papers:", "call for papers -", "call for papers", "cfp:", "cfp -")
+
+
 def normalize_name(name):
     """Normalize conference name for matching."""
     name = name.lower()
+    # Most names have no digits and no CFP prefix: only whitespace needs cleaning
+    has_prefix = name.startswith(_CFP_PREFIXES)
+    if not has_prefix and not _RE_DIGIT.search(name):
+        return " ".join(name.split())
     # Remove common prefixes
-    for prefix in ["call for papers:", "call for papers -", "call for papers", "cfp:", "cfp -"]:
-        if name.startswith(prefix):
-            name = name[len(prefix):]
-    # Remove year patterns
-    name = re.sub(r'\b20\d{2}\b', '', name)
-    # Remove ordinal numbers (1st, 2nd, 3rd, 4th, 5th, etc.)
-    name = re.sub(r'\b\d+(st|nd|rd|th)\b', '', name)
-    # Remove standalone numbers
-    name = re.sub(r'\b\d+\b', '', name)
+    if has_prefix:
+        for prefix in _CFP_PREFIXES:
+            if name.startswith(prefix):
+                name = name[len(prefix):]
+    # Remove years, ordinal numbers and standalone numbers
+    name = _RE_NUMBERS.sub('', name)
     # Clean up extra spaces
-    name = re.sub(r'\s+', ' ', name).strip()
+    name = " ".join(name.split())
     return name
 
 
+# TIER_REFERENCE split into parallel lists (indexed by position in the hot loops),
+# plus the pattern forms computed once at import instead of once per conference
+PATTERNS, TIERS, DISCS = map(list, zip(*TIER_REFERENCE))
+PATTERNS_LOWER = [p.lower() for p in PATTERNS]
+PATTERNS_NORM = [normalize_name(p) for p in PATTERNS]
+
+FUZZY_THRESHOLD = 0.70  # 70% similarity threshold
+RAPIDFUZZ_CUTOFF = FUZZY_THRESHOLD * 100 - 0.01  # Same threshold on rapidfuzz's 0-100 scale, float slack
+# One SequenceMatcher per pattern with the pattern as seq2: its b2j index is built
+# once here, and set_seq1() swaps in each conference name without rebuilding it
+PATTERN_MATCHERS = [SequenceMatcher(None, b=p) for p in PATTERNS_NORM]
+
+
+def build_pattern_automaton(patterns):
+    """Aho-Corasick automaton mapping each pattern to its first index in the list."""
+    automaton = ahocorasick.Automaton()
+    for i, pattern in enumerate(patterns):
+        if pattern not in automaton:  # Duplicates keep the earlier (higher priority) index
+            automaton.add_word(pattern, i)
+    automaton.make_automaton()
+    return automaton
+
+
+PATTERN_AUTOMATON = build_pattern_automaton(PATTERNS_LOWER) if ahocorasick else None
+
+
+def first_pattern_in(text):
+    """Index of the first TIER_REFERENCE pattern (in list order) contained in text, or None."""
+    if PATTERN_AUTOMATON is not None:
+        return min((i for _, i in PATTERN_AUTOMATON.iter(text)), default=None)
+    for i, pattern_lower in enumerate(PATTERNS_LOWER):
+        if pattern_lower in text:
+            return i
+    return None
+
+
+def match_substring(name_lower, normalized):
+    """Passes 1-2 of match_reference. Returns (tier, method) or None."""
+    # Pass 1: Direct substring match (fast, high confidence)
+    i = first_pattern_in(name_lower)
+    if i is not None:
+        return TIERS[i], f"exact:{PATTERNS[i]}"
+
+    # Pass 2: Normalized substring match (if normalization changed nothing,
+    # Pass 1 already scanned this exact string)
+    if normalized != name_lower:
+        i = first_pattern_in(normalized)
+        if i is not None:
+            return TIERS[i], f"normalized:{PATTERNS[i]}"
+
+    return None
+
+
 def match_reference(conf_name):
     """
     Try to match conference name against reference dictionary.
     Returns (tier, method) or (None, None) if no match.
     """
     normalized = normalize_name(conf_name)
-    name_lower = conf_name.lower()
-
-    # Pass 1: Direct substring match (fast, high confidence)
-    for pattern, tier, disc in TIER_REFERENCE:
-        if pattern.lower() in name_lower:
-            return tier, f"exact:{pattern}"
-
-    # Pass 2: Normalized substring match
-    for pattern, tier, disc in TIER_REFERENCE:
-        if pattern.lower() in normalized:
-            return tier, f"normalized:{pattern}"
-
-    # Pass 3: Fuzzy match (slower, for slight variations)
+    hit = match_substring(conf_name.lower(), normalized)
+    if hit is not None:
+        return hit
+
+    # Pass 3 depends only on the normalized name, so series that differ only by
+    # year or edition ("AFA 2025" / "AFA 2026") share one cached result
+    return match_fuzzy(normalized)
+
+
+@lru_cache(maxsize=4096)
+def match_fuzzy(normalized):
+    """Pass 3 of match_reference: fuzzy match (slower, for slight variations)."""
+    # Too short for a meaningful similarity ratio
+    if len(normalized) < 4:
+        return None, None
+
+    candidates = range(len(PATTERNS))
+    if process is not None:
+        # rapidfuzz's Indel ratio is an upper bound on SequenceMatcher.ratio(), so a single
+        # C-level call discards every pattern that cannot reach the threshold; only the
+        # survivors get the exact difflib score.
+        hits = process.extract(normalized, PATTERNS_NORM, scorer=fuzz.ratio,
+                               score_cutoff=RAPIDFUZZ_CUTOFF, limit=None)
+        candidates = sorted(idx for _, _, idx in hits)
+    return best_fuzzy_match(normalized, candidates)
+
+
+def best_fuzzy_match(normalized, candidates):
+    """Score candidate pattern indices (ascending) with SequenceMatcher; first best wins."""
     best_score = 0
     best_tier = None
     best_pattern = None
 
-    for pattern, tier, disc in TIER_REFERENCE:
+    for i in candidates:
         # Use SequenceMatcher for fuzzy comparison
-        score = SequenceMatcher(None, normalized, normalize_name(pattern)).ratio()
+        sm = PATTERN_MATCHERS[i]
+        sm.set_seq1(normalized)
+        # Cheap upper bounds first: skip patterns that cannot reach the threshold
+        # or beat the best score so far
+        bound = sm.real_quick_ratio()
+        if bound < FUZZY_THRESHOLD or bound <= best_score:
+            continue
+        bound = sm.quick_ratio()
+        if bound < FUZZY_THRESHOLD or bound <= best_score:
+            continue
+        score = sm.ratio()
         if score > best_score:
             best_score = score
-            best_tier = tier
-            best_pattern = pattern
+            best_tier = TIERS[i]
+            best_pattern = PATTERNS[i]
+            if score == 1.0:  # Cannot be beaten
+                break
 
-    if best_score >= 0.70:  # 70% similarity threshold
+    if best_score >= FUZZY_THRESHOLD:
         return best_tier, f"fuzzy({best_score:.0%}):{best_pattern}"
 
     return None, None
 
 
+def match_references(names):
+    """
+    Batch version of match_reference for a list of conference names.
+    Returns a list of (tier, method) tuples in the same order.
+    """
+    if process is None:
+        # Pure-Python difflib path: spread large batches over all cores
+        if len(names) > PARALLEL_MIN_NAMES:
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(match_reference, names, chunksize=64))
+        return [match_reference(name) for name in names]
+    if np is None:
+        return [match_reference(name) for name in names]
+
+    results = []
+    pending = {}  # normalized name -> positions still needing Pass 3
+    for pos, name in enumerate(names):
+        normalized = normalize_name(name)
+        hit = match_substring(name.lower(), normalized)
+        if hit is None and len(normalized) >= 4:
+            pending.setdefault(normalized, []).append(pos)
+        results.append(hit or (None, None))
+
+    if pending:
+        # Whole (unique names x patterns) similarity matrix in one multithreaded call;
+        # entries below the cutoff come back as 0
+        queries = list(pending)
+        scores = process.cdist(queries, PATTERNS_NORM, scorer=fuzz.ratio,
+                               score_cutoff=RAPIDFUZZ_CUTOFF, workers=-1)
+        for query, row in zip(queries, scores):
+            result = best_fuzzy_match(query, np.flatnonzero(row))
+            for pos in pending[query]:
+                results[pos] = result
+
+    return results
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CLAUDE API FALLBACK
 # ─────────────────────────────────────────────────────────────────────────────
 
-def assign_tier_via_api(conferences):
+# Static instructions shared by every request. Sent as a system block marked for
+# prompt caching, so only the per-batch conference list is billed as fresh input.
+TIER_SYSTEM_PROMPT = """You are an expert in academic finance, accounting, and economics conferences. 
+Assign a tier (1, 2, or 3) to each conference you are given.
+
+Tier definitions:
+- Tier 1: Elite conferences. Very selective, invite-only or <10% acceptance rate. Papers presented here frequently appear in top-5 journals (JF, JFE, RFS for finance; JAR, JAE, TAR for accounting; AER, QJE, JPE, Ecta, RES for economics). Examples: AFA, WFA, NBER workshops, SFS Cavalcade, Utah Winter Finance, JAR Conference.
+- Tier 2: Strong, well-regarded conferences. Respected association meetings and good field conferences. Regular acceptance rates, strong programs. Examples: EFA, FIRS, FMA, AAA Annual, NFA, EEA-ESEM, CEPR workshops, Paris December Finance Meeting.
+- Tier 3: Regional, niche, or newer conferences. Broader acceptance, less selective, or focused on a narrow audience. Examples: directional FAs (SFA, SWFA), regional economics meetings, country-specific conferences, newer/smaller workshops.
+
+If you cannot determine the tier with reasonable confidence, assign tier 3 as default."""
+
+TIER_SYSTEM = [{"type": "text", "text": TIER_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+
+class RateLimiter:
+    """
+    Sliding one-minute window over requests and (estimated) input tokens.
+    Waits before a request would exceed either limit instead of retrying on 429s.
+    """
+
+    def __init__(self, requests_per_min, tokens_per_min):
+        self.requests_per_min = requests_per_min
+        self.tokens_per_min = tokens_per_min
+        self.sent = deque()  # (monotonic time, tokens) per request in the last minute
+        self.lock = asyncio.Lock()
+
+    async def acquire(self, tokens):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                while self.sent and now - self.sent[0][0] >= 60:
+                    self.sent.popleft()
+                used = sum(t for _, t in self.sent)
+                # An empty window always admits, even a request larger than the token limit
+                if not self.sent or (len(self.sent) < self.requests_per_min
+                                     and used + tokens <= self.tokens_per_min):
+                    self.sent.append((now, tokens))
+                    return
+                await asyncio.sleep(60 - (now - self.sent[0][0]))
+
+
+async def assign_tier_via_api(conferences):
     """
     Use Claude API to assign tiers to unknown conferences.
-    Sends conferences in batches for efficiency.
+    Sends conferences in batches of 20, several batches in flight at once.
     Returns dict of {conf_id: tier}.
     """
     try:
@@ -454,31 +670,18 @@ def assign_tier_via_api(conferences):
         log.warning("ANTHROPIC_API_KEY not set. Skipping API tier assignment.")
         return {}
 
-    client = anthropic.Anthropic(api_key=api_key)
+    semaphore = asyncio.Semaphore(API_CONCURRENCY)
+    limiter = RateLimiter(API_REQUESTS_PER_MIN, API_INPUT_TOKENS_PER_MIN)
     results = {}
 
-    # Process in batches of 20
-    batch_size = 20
-    for i in range(0, len(conferences), batch_size):
-        batch = conferences[i:i+batch_size]
-
+    async def classify_batch(batch, batch_num):
         conf_list = ""
         for conf in batch:
             disc_str = ", ".join(conf.get("disc", []))
             location = conf.get("location", "Unknown")
             conf_list += f'- ID:{conf["id"]} | Name: {conf["name"]} | Discipline: {disc_str} | Location: {location}\n'
 
-        prompt = f"""You are an expert in academic finance, accounting, and economics conferences. 
-Assign a tier (1, 2, or 3) to each conference below.
-
-Tier definitions:
-- Tier 1: Elite conferences. Very selective, invite-only or <10% acceptance rate. Papers presented here frequently appear in top-5 journals (JF, JFE, RFS for finance; JAR, JAE, TAR for accounting; AER, QJE, JPE, Ecta, RES for economics). Examples: AFA, WFA, NBER workshops, SFS Cavalcade, Utah Winter Finance, JAR Conference.
-- Tier 2: Strong, well-regarded conferences. Respected association meetings and good field conferences. Regular acceptance rates, strong programs. Examples: EFA, FIRS, FMA, AAA Annual, NFA, EEA-ESEM, CEPR workshops, Paris December Finance Meeting.
-- Tier 3: Regional, niche, or newer conferences. Broader acceptance, less selective, or focused on a narrow audience. Examples: directional FAs (SFA, SWFA), regional economics meetings, country-specific conferences, newer/smaller workshops.
-
-If you cannot determine the tier with reasonable confidence, assign tier 3 as default.
-
-Conferences to classify:
+        prompt = f"""Conferences to classify:
 {conf_list}
 
 Respond with ONLY a JSON object mapping IDs to tiers, like:
@@ -486,41 +689,171 @@ Respond with ONLY a JSON object mapping IDs to tiers, like:
 
 No other text. Just the JSON object."""
 
-        try:
-            response = client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=1000,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            text = response.content[0].text.strip()
-            # Parse JSON response
-            text = re.sub(r'```json\s*', '', text)
-            text = re.sub(r'```\s*', '', text)
-            tier_map = json.loads(text)
-
-            for conf_id_str, tier in tier_map.items():
-                conf_id = int(conf_id_str)
-                tier = int(tier)
-                if tier in (1, 2, 3):
-                    results[conf_id] = tier
-
-            log.info(f"  API batch {i//batch_size + 1}: classified {len(tier_map)} conferences")
-
-        except Exception as e:
-            log.warning(f"  API batch {i//batch_size + 1} failed: {e}")
-            continue
-
+        async with semaphore:
+            # ~4 characters per token is close enough for pacing
+            await limiter.acquire((len(TIER_SYSTEM_PROMPT) + len(prompt)) // 4)
+            try:
+                response = await client.messages.create(
+                    model="claude-sonnet-4-20250514",
+                    max_tokens=1000,
+                    system=TIER_SYSTEM,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                text = response.content[0].text.strip()
+                # Parse JSON response
+                text = re.sub(r'```json\s*', '', text)
+                text = re.sub(r'```\s*', '', text)
+                tier_map = json.loads(text)
+
+                for conf_id_str, tier in tier_map.items():
+                    conf_id = int(conf_id_str)
+                    tier = int(tier)
+                    if tier in (1, 2, 3):
+                        results[conf_id] = tier
+
+                log.info(f"  API batch {batch_num}: classified {len(tier_map)} conferences")
+
+            except Exception as e:
+                log.warning(f"  API batch {batch_num} failed: {e}")
+
+    # Process in batches of 20; the client's connection pool is closed once all are done
+    batch_size = 20
+    async with anthropic.AsyncAnthropic(api_key=api_key) as client:
+        await asyncio.gather(*(
+            classify_batch(conferences[i:i+batch_size], i//batch_size + 1)
+            for i in range(0, len(conferences), batch_size)
+        ))
     return results
 
 
+def open_tier_cache(path, read_only=False):
+    """
+    Open the API verdict cache, dropping entries older than CACHE_TTL_DAYS.
+    With read_only (--dry-run) it works on an in-memory copy and the file is never written.
+    """
+    if read_only:
+        cache = sqlite3.connect(":memory:")
+        if path.exists():
+            disk = sqlite3.connect(f"{path.absolute().as_uri()}?mode=ro", uri=True)
+            disk.backup(cache)
+            disk.close()
+    else:
+        cache = sqlite3.connect(path)
+    cache.execute("CREATE TABLE IF NOT EXISTS tiers "
+                  "(norm_name TEXT PRIMARY KEY, tier INT, source TEXT, ts REAL)")
+    cache.execute("DELETE FROM tiers WHERE ts < ?", (time.time() - CACHE_TTL_DAYS * 86400,))
+    cache.commit()
+    return cache
+
+
+def load_cached_tiers(cache, names):
+    """Returns {normalized_name: tier} for the names already in the cache."""
+    found = {}
+    for name in names:
+        row = cache.execute("SELECT tier FROM tiers WHERE norm_name = ?", (name,)).fetchone()
+        if row:
+            found[name] = row[0]
+    return found
+
+
+def store_cached_tiers(cache, tiers_by_name, source):
+    now = time.time()
+    cache.executemany("INSERT OR REPLACE INTO tiers VALUES (?, ?, ?, ?)",
+                      [(name, tier, source, now) for name, tier in tiers_by_name.items()])
+    cache.commit()
+
+
+def assign_tier_via_batch_api(conferences):
+    """
+    Same as assign_tier_via_api, but submits one Message Batches job with a
+    request per conference and polls until it has ended, cancelling it after
+    BATCH_MAX_WAIT_HOURS. Returns dict of {conf_id: tier}.
+    """
+    try:
+        import anthropic
+    except ImportError:
+        log.warning("anthropic package not installed. Run: pip install anthropic")
+        return {}
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        log.warning("ANTHROPIC_API_KEY not set. Skipping API tier assignment.")
+        return {}
+
+    client = anthropic.Anthropic(api_key=api_key)
+    requests = []
+    for conf in conferences:
+        disc_str = ", ".join(conf.get("disc", []))
+        location = conf.get("location", "Unknown")
+        prompt = f"""Conference to classify:
+- Name: {conf["name"]} | Discipline: {disc_str} | Location: {location}
+
+Respond with ONLY the tier number (1, 2, or 3). No other text."""
+        requests.append({
+            "custom_id": str(conf["id"]),
+            "params": {
+                "model": "claude-sonnet-4-20250514",
+                "max_tokens": 5,
+                "system": TIER_SYSTEM,
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        })
+
+    try:
+        batch = client.messages.batches.create(requests=requests)
+        log.info(f"  Submitted batch {batch.id} with {len(requests)} requests")
+        give_up_at = time.monotonic() + BATCH_MAX_WAIT_HOURS * 3600
+        while batch.processing_status != "ended":
+            if time.monotonic() >= give_up_at:
+                log.warning(f"  Batch {batch.id} not ended after {BATCH_MAX_WAIT_HOURS} h; "
+                            f"cancelling it, its conferences get the default tier")
+                client.messages.batches.cancel(batch.id)
+                return {}
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = client.messages.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            log.info(f"  Batch {batch.id}: {counts.processing} processing, {counts.succeeded} succeeded")
+
+        results = {}
+        for entry in client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                continue
+            text = entry.result.message.content[0].text.strip()
+            if text in ("1", "2", "3"):
+                results[int(entry.custom_id)] = int(text)
+        log.info(f"  Batch {batch.id}: classified {len(results)} conferences")
+        return results
+
+    except Exception as e:
+        log.warning(f"  Batch API failed: {e}")
+        return {}
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # MAIN PIPELINE
 # ─────────────────────────────────────────────────────────────────────────────
 
+def load_conferences(path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_conferences(path, conferences):
+    # orjson's OPT_INDENT_2 output is byte-identical to json.dump(indent=2, ensure_ascii=False)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(conferences, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(conferences, f, indent=2, ensure_ascii=False)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Assign tiers to conferences")
     parser.add_argument("--all", action="store_true", help="Re-assign ALL tiers (overwrite existing)")
     parser.add_argument("--no-api", action="store_true", help="Skip Claude API fallback")
+    parser.add_argument("--batch-api", action="store_true", help="Use the Message Batches API for the Claude fallback")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without saving")
     parser.add_argument("--json", type=str, default="conferences.json", help="Path to conferences.json")
     args = parser.parse_args()
@@ -528,13 +861,13 @@ def main():
     global JSON_PATH
     JSON_PATH = Path(args.json)
 
+    setup_logging()
     log.info("===========================================")
     log.info("  Conference Tier Assigner")
     log.info("===========================================")
 
     # Load conferences
-    with open(JSON_PATH, encoding="utf-8") as f:
-        conferences = json.load(f)
+    conferences = load_conferences(JSON_PATH)
 
     log.info(f"Loaded {len(conferences)} conferences")
 
@@ -555,12 +888,14 @@ def main():
     matched = 0
     unmatched = []
 
-    for conf in to_assign:
-        tier, method = match_reference(conf["name"])
+    names = [conf["name"] for conf in to_assign]
+    for conf, (tier, method) in zip(to_assign, match_references(names)):
         if tier is not None:
             conf["tier"] = str(tier)
             matched += 1
-            log.info(f"  [{tier}] {conf['name'][:60]} ({method})")
+            log.debug(f"  [{tier}] {conf['name'][:60]} ({method})")
+            if matched % 100 == 0:
+                log.info(f"  ... {matched} matched so far")
         else:
             unmatched.append(conf)
 
@@ -568,22 +903,49 @@ def main():
 
     # Phase 2: Claude API fallback
     if unmatched and not args.no_api:
-        log.info(f"\n=== Phase 2: Claude API for {len(unmatched)} unknowns ===")
-        api_results = assign_tier_via_api(unmatched)
-
+        # Names that differ only by year/edition normalize the same; classify one
+        # conference per name and copy its tier to the rest of the group.
+        groups = {}
+        for conf in unmatched:
+            groups.setdefault(normalize_name(conf["name"]), []).append(conf)
+
+        cache = open_tier_cache(CACHE_PATH, read_only=args.dry_run)
+        tiers_by_name = load_cached_tiers(cache, groups)
+        representatives = [group[0] for name, group in groups.items() if name not in tiers_by_name]
+
+        log.info(f"\n=== Phase 2: Claude API for {len(representatives)} unknowns "
+                 f"({len(tiers_by_name)} cached, {len(unmatched)} conferences) ===")
+        if representatives:
+            if args.batch_api:
+                fresh = assign_tier_via_batch_api(representatives)
+            else:
+                fresh = asyncio.run(assign_tier_via_api(representatives))
+            fresh_by_name = {name: fresh[group[0]["id"]] for name, group in groups.items()
+                             if group[0]["id"] in fresh}
+            store_cached_tiers(cache, fresh_by_name, "batch-api" if args.batch_api else "api")
+            tiers_by_name.update(fresh_by_name)
+        cache.close()
+
+        api_results = {conf["id"]: tiers_by_name[name]
+                       for name, group in groups.items() if name in tiers_by_name
+                       for conf in group}
+
+        # Anything the API did not classify (and that has no tier from an
+        # earlier run, under --all) defaults to tier 3
         api_assigned = 0
+        defaulted = []
         for conf in unmatched:
-            if conf["id"] in api_results:
-                conf["tier"] = str(api_results[conf["id"]])
+            tier = api_results.get(conf["id"])
+            if tier is not None:
+                conf["tier"] = str(tier)
                 api_assigned += 1
-                log.info(f"  [{conf['tier']}] {conf['name'][:60]} (api)")
-
-        still_unmatched = [c for c in unmatched if not c.get("tier")]
-        log.info(f"\nAPI assigned: {api_assigned} | Still unmatched: {len(still_unmatched)}")
+                log.debug(f"  [{conf['tier']}] {conf['name'][:60]} (api)")
+            elif not conf.get("tier"):
+                conf["tier"] = "3"
+                defaulted.append(conf)
 
-        # Default remaining to tier 3
-        for conf in still_unmatched:
-            conf["tier"] = "3"
+        log.info(f"\nAPI assigned: {api_assigned} | Still unmatched: {len(defaulted)}")
+        for conf in defaulted:
             log.info(f"  [3] {conf['name'][:60]} (default)")
 
     elif unmatched and args.no_api:
@@ -608,8 +970,7 @@ def main():
 
     # Save
     if not args.dry_run:
-        with open(JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(conferences, f, indent=2, ensure_ascii=False)
+        save_conferences(JSON_PATH, conferences)
         log.info(f"\nSaved to {JSON_PATH}")
     else:
         log.info(f"\n(Dry run — no changes saved)")
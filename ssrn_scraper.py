@@ -6,10 +6,17 @@ Scrapes SSRN professional announcements (FEN/ARN/ERN) to build and update
 a conference tracker JSON file with deadlines, dates, and locations.
 
 SSRN blocks simple HTTP requests, so this uses Playwright (headless browser).
+With httpx installed, detail pages are first tried over plain HTTP using the
+browser's cookies, falling back to Playwright per page.
 
 Setup (one time):
     pip install playwright
     playwright install chromium
+    pip install pyahocorasick         # Optional: single-pass keyword filtering
+    pip install google-re2            # Optional: linear-time date pattern matching
+    pip install orjson                # Optional: faster conferences.json load/save
+    pip install httpx                 # Optional: fetch detail pages without rendering them
+    pip install h2                    # Optional: HTTP/2 for those plain-HTTP fetches
 
 Usage:
     python ssrn_scraper.py                    # Full scrape: listing + deadlines
@@ -21,9 +28,39 @@ Output:
     scrape_log.txt    - Detailed log of what was found/changed
 """
 
-import json, re, os, sys, time, argparse, logging, random
+import json, re, os, sys, time, argparse, asyncio, logging, sqlite3
 from datetime import datetime, date
 from pathlib import Path
+from urllib.parse import urlparse
+from functools import lru_cache
+from collections import deque
+from html.parser import HTMLParser
+from logging.handlers import MemoryHandler
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Fall back to one substring test per keyword
+
+try:
+    import re2
+except ImportError:
+    re2 = None  # Fall back to the stdlib (backtracking) re engine
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # Every detail page goes through the browser
+
+try:
+    import h2
+except ImportError:
+    h2 = None  # httpx falls back to HTTP/1.1 keep-alive
 
 # --- Configuration ---
 
@@ -45,8 +82,23 @@ CONFERENCE_SECTIONS = [
 ]
 
 PAGE_DELAY = 2.0
+DETAIL_WORKERS = 4  # Detail pages loaded concurrently (tabs in the shared browser context)
+HTTP_FAILURE_LIMIT = 3  # Consecutive plain-HTTP failures before the rest of the run uses only the browser
+SSRN_REQUESTS_PER_SECOND = 1.0  # Average request rate to ssrn.com across all workers and both transports
+PROFILE_DIR = Path(".pw_profile")  # Browser profile kept between runs (cookies, Cloudflare clearance)
+# Requests never needed for the text we extract: heavy asset types, tracking beacons,
+# and anything not served by SSRN or Cloudflare's challenge (analytics, tag managers,
+# share widgets). Stylesheets stay: innerText leaves out whatever the site's CSS hides.
+# Scripts stay too: the Cloudflare challenge only clears with JavaScript running.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "ping", "manifest", "texttrack"})
+ALLOWED_HOSTS = (".ssrn.com", ".cloudflare.com")
 JSON_PATH = Path("conferences.json")
 LOG_PATH = Path("scrape_log.txt")
+DETAIL_CACHE_PATH = Path(".ssrn_cache.json")  # sid -> last detail-page result
+DETAIL_CACHE_TTL_DAYS = 3  # Re-visit a page after this long, or sooner if SSRN re-posts it
+DETAIL_CACHE_SAVE_EVERY = 25  # Newly visited pages between cache saves (plus one at the end)
+HTTP_CACHE_PATH = Path(".ssrn_http_cache.sqlite")  # ETag/Last-Modified + page text for conditional GETs
+HTTP_CACHE_TTL_DAYS = 60
 
 # Non-conference items to filter out (prizes, PhD programs, summer schools, job posts, etc.)
 NON_CONFERENCE_KEYWORDS = [
@@ -83,33 +135,55 @@ CONFERENCE_SAFELIST = [
     'workshop', 'symposium', 'forum', 'summit',
 ]
 
+def build_keyword_automaton():
+    """Aho-Corasick automaton mapping each filter keyword to the lists it appears in."""
+    automaton = ahocorasick.Automaton()
+    for kind, keywords in (("junk", NON_CONFERENCE_KEYWORDS),
+                           ("exact", NON_CONFERENCE_EXACT),
+                           ("safe", CONFERENCE_SAFELIST)):
+        for kw in keywords:
+            automaton.add_word(kw, automaton.get(kw, ()) + (kind,))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = build_keyword_automaton() if ahocorasick else None
+
+
 def is_non_conference(name):
     """Return True if the item is not a real conference (prize, PhD program, etc.)."""
     name_lower = name.lower()
-    for kw in NON_CONFERENCE_KEYWORDS:
-        if kw in name_lower:
-            # Check safelist — real conferences that happen to match a junk keyword
-            for safe in CONFERENCE_SAFELIST:
-                if safe in name_lower:
-                    return False
-            return True
-    for kw in NON_CONFERENCE_EXACT:
-        if kw in name_lower and 'conference' not in name_lower:
-            return True
-    return False
+    if KEYWORD_AUTOMATON is not None:
+        # One pass over the name finds every junk, exact and safelist keyword
+        found = set()
+        for _, kinds in KEYWORD_AUTOMATON.iter(name_lower):
+            found.update(kinds)
+        if "junk" in found:
+            return "safe" not in found
+        return "exact" in found and 'conference' not in name_lower
+    if any(kw in name_lower for kw in NON_CONFERENCE_KEYWORDS):
+        # Check safelist — real conferences that happen to match a junk keyword.
+        # It only rescues junk hits; NON_CONFERENCE_EXACT has its own 'conference' test.
+        return not any(safe in name_lower for safe in CONFERENCE_SAFELIST)
+    return 'conference' not in name_lower and any(kw in name_lower for kw in NON_CONFERENCE_EXACT)
 
 # --- Logging ---
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s  %(message)s",
-    datefmt="%H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(LOG_PATH, mode="w", encoding="utf-8"),
-    ],
-)
+LOG_FORMAT = logging.Formatter("%(asctime)s  %(message)s", datefmt="%H:%M:%S")
+
+# The log file is written in batches of LOG_BUFFER_LINES records instead of once per
+# line; any warning flushes straight away, and logging's exit hook flushes the rest.
+LOG_BUFFER_LINES = 200
+log_file = logging.FileHandler(LOG_PATH, mode="w", encoding="utf-8")
+log_file.setFormatter(LOG_FORMAT)
+log_buffer = MemoryHandler(LOG_BUFFER_LINES, flushLevel=logging.WARNING, target=log_file)
+console = logging.StreamHandler()
+console.setFormatter(LOG_FORMAT)
+
+logging.basicConfig(level=logging.INFO, handlers=[console, log_buffer])
 log = logging.getLogger(__name__)
+# httpx logs every request at INFO; only its warnings belong in the scrape log
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # --- Date Parsing ---
 
@@ -120,64 +194,84 @@ MONTH_MAP = {
     "oct": 10, "october": 10, "nov": 11, "november": 11, "dec": 12, "december": 12,
 }
 
+def iso_date(year, month, day):
+    # One C-level %-format call, e.g. (2026, 3, 5) -> "2026-03-05"
+    return "%d-%02d-%02d" % (year, month, day)
+
+
+# parse_date_flexible formats, tried in this order
+ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+SLASH_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+MONTH_DAY_YEAR_RE = re.compile(r"(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})")
+DAY_MONTH_YEAR_RE = re.compile(r"(\d{1,2})(?:st|nd|rd|th)?\s+(\w+),?\s+(\d{4})")
+
+
+# Pure functions over a small set of recurring strings: cache their results
+@lru_cache(maxsize=4096)
 def parse_date_flexible(text):
     if not text:
         return None
     text = text.strip().rstrip(".").replace(".", "")
 
-    m = re.match(r"(\d{4})-(\d{2})-(\d{2})", text)
+    m = ISO_DATE_RE.match(text)
     if m:
         return text[:10]
 
     # "MM/DD/YYYY"
-    m = re.match(r"(\d{1,2})/(\d{1,2})/(\d{4})", text)
+    m = SLASH_DATE_RE.match(text)
     if m:
-        return f"{int(m.group(3))}-{int(m.group(1)):02d}-{int(m.group(2)):02d}"
+        return iso_date(int(m.group(3)), int(m.group(1)), int(m.group(2)))
 
     # "Month DD, YYYY" or "Month DD YYYY"
-    m = re.match(r"(\w+)\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})", text)
+    m = MONTH_DAY_YEAR_RE.match(text)
     if m:
         month = MONTH_MAP.get(m.group(1).lower()[:3])
         if month:
-            return f"{int(m.group(3))}-{month:02d}-{int(m.group(2)):02d}"
+            return iso_date(int(m.group(3)), month, int(m.group(2)))
 
     # "DD Month, YYYY" or "DD Month YYYY"
-    m = re.match(r"(\d{1,2})(?:st|nd|rd|th)?\s+(\w+),?\s+(\d{4})", text)
+    m = DAY_MONTH_YEAR_RE.match(text)
     if m:
         month = MONTH_MAP.get(m.group(2).lower()[:3])
         if month:
-            return f"{int(m.group(3))}-{month:02d}-{int(m.group(1)):02d}"
+            return iso_date(int(m.group(3)), month, int(m.group(1)))
 
     return None
 
 
+# "11 Jul 2026" with an optional "- 13 Jul 2026" tail. The start date is captured
+# identically whether or not the tail is present, so one match replaces the old
+# range-then-single pair.
+CONF_DATES_RE = re.compile(r"(\d{1,2})\s+(\w+)\s+(\d{4})(?:\s*-\s*(\d{1,2})\s+(\w+)\s+(\d{4}))?")
+
+
+@lru_cache(maxsize=4096)
 def parse_conf_dates(date_str):
     date_str = date_str.strip()
     if not date_str:
         return ("", "")
 
-    m = re.match(r"(\d{1,2})\s+(\w+)\s+(\d{4})\s*-\s*(\d{1,2})\s+(\w+)\s+(\d{4})", date_str)
-    if m:
-        d1, m1, y1 = int(m.group(1)), m.group(2), int(m.group(3))
-        d2, m2, y2 = int(m.group(4)), m.group(5), int(m.group(6))
-        month1 = MONTH_MAP.get(m1.lower()[:3])
+    m = CONF_DATES_RE.match(date_str)
+    if not m:
+        return ("", date_str)
+
+    d1, m1, y1 = int(m.group(1)), m.group(2), int(m.group(3))
+    month1 = MONTH_MAP.get(m1.lower()[:3])
+    if m.group(4):
+        d2, m2 = int(m.group(4)), m.group(5)
         month2 = MONTH_MAP.get(m2.lower()[:3])
         if month1 and month2:
-            start = f"{y1}-{month1:02d}-{d1:02d}"
+            start = iso_date(y1, month1, d1)
             if m1[:3] == m2[:3]:
                 display = f"{m1[:3]} {d1}-{d2}"
             else:
                 display = f"{m1[:3]} {d1} - {m2[:3]} {d2}"
             return (start, display)
 
-    m = re.match(r"(\d{1,2})\s+(\w+)\s+(\d{4})", date_str)
-    if m:
-        d1, m1, y1 = int(m.group(1)), m.group(2), int(m.group(3))
-        month1 = MONTH_MAP.get(m1.lower()[:3])
-        if month1:
-            start = f"{y1}-{month1:02d}-{d1:02d}"
-            display = f"{m1[:3]} {d1}"
-            return (start, display)
+    if month1:
+        start = iso_date(y1, month1, d1)
+        display = f"{m1[:3]} {d1}"
+        return (start, display)
 
     return ("", date_str)
 
@@ -259,9 +353,49 @@ DEADLINE_PATTERNS = [
     r"(\d{1,2}(?:st|nd|rd|th)?\s+\w+,?\s+\d{4}).{0,40}?(?:[Cc]losing|[Dd]eadline)",
 ]
 
-def extract_deadline_from_text(text):
-    for pattern in DEADLINE_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
+def compile_linear(pattern, flags=""):
+    """
+    Compile with RE2 when available: matching is linear in the text length, which
+    keeps the lazy .{0,60}? bridges cheap on long pages. Flags are inline letters
+    ("i", "im") so both engines accept them. Falls back to re for anything RE2 rejects.
+    """
+    source = f"(?{flags}){pattern}" if flags else pattern
+    if re2 is not None:
+        try:
+            return re2.compile(source)
+        except re2.error:
+            pass
+    return re.compile(source)
+
+
+# Compiled once at import. Patterns are tried in list order (earlier = more specific),
+# so they stay separate rather than fused into one alternation: a fused regex returns
+# the leftmost match of any pattern, not the match of the highest-priority pattern.
+DEADLINE_RES = [compile_linear(p, "i") for p in DEADLINE_PATTERNS]
+
+# Second-pass patterns for dates written without a year
+NO_YEAR_PATTERNS = [
+    # "is [Day,] DD Month" or "is [Day,] Month DD"
+    r"deadline\s+is\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\d{1,2}(?:st|nd|rd|th)?\s+\w+)\b",
+    r"deadline\s+is\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\w+\.?\s+\d{1,2}(?:st|nd|rd|th)?)\b",
+    # "by/on/until [Day,] Month DDth" or "Month DD"
+    r"(?:by|on|until|through|before)\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\w+\.?\s+\d{1,2}(?:st|nd|rd|th)?)\b",
+    r"(?:by|on|until|through|before)\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\d{1,2}(?:st|nd|rd|th)?\s+\w+)\b",
+    # "Deadline ... Month DD" / "Closing ... Month DD"
+    r"[Dd]eadline.{0,60}?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)\b",
+    r"[Cc]losing.{0,30}?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)\b",
+    # "Due: Month DD"
+    r"[Dd]ue[:\s]+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)\b",
+]
+NO_YEAR_RES = [compile_linear(p, "i") for p in NO_YEAR_PATTERNS]
+
+# Year assumed for dates written without one (a run never spans more than a day)
+CURRENT_YEAR = date.today().year
+
+
+def extract_deadline_from_text(text, deadline_res=DEADLINE_RES, no_year_res=NO_YEAR_RES):
+    for rx in deadline_res:
+        match = rx.search(text)
         if match:
             parsed = parse_date_flexible(match.group(1))
             if parsed:
@@ -271,27 +405,12 @@ def extract_deadline_from_text(text):
 
     # Second pass: try patterns WITHOUT year (Month DD, DD Month, etc.)
     # and infer year from context
-    NO_YEAR_PATTERNS = [
-        # "is [Day,] DD Month" or "is [Day,] Month DD"
-        r"deadline\s+is\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\d{1,2}(?:st|nd|rd|th)?\s+\w+)\b",
-        r"deadline\s+is\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\w+\.?\s+\d{1,2}(?:st|nd|rd|th)?)\b",
-        # "by/on/until [Day,] Month DDth" or "Month DD"
-        r"(?:by|on|until|through|before)\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\w+\.?\s+\d{1,2}(?:st|nd|rd|th)?)\b",
-        r"(?:by|on|until|through|before)\s+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\d{1,2}(?:st|nd|rd|th)?\s+\w+)\b",
-        # "Deadline ... Month DD" / "Closing ... Month DD"
-        r"[Dd]eadline.{0,60}?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)\b",
-        r"[Cc]losing.{0,30}?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)\b",
-        # "Due: Month DD"
-        r"[Dd]ue[:\s]+(?:(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),?\s+)?(\w+\s+\d{1,2}(?:st|nd|rd|th)?)\b",
-    ]
-    from datetime import date as _date
-    current_year = _date.today().year
-    for pattern in NO_YEAR_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for rx in no_year_res:
+        match = rx.search(text)
         if match:
             raw = match.group(1).strip().rstrip(".")
             # Try appending current year and next year, pick the one that makes sense
-            for try_year in [current_year, current_year + 1, current_year - 1]:
+            for try_year in [CURRENT_YEAR, CURRENT_YEAR + 1, CURRENT_YEAR - 1]:
                 parsed = parse_date_flexible(raw + f", {try_year}")
                 if not parsed:
                     parsed = parse_date_flexible(raw + f" {try_year}")
@@ -344,133 +463,184 @@ US_STATES = {
     "VA","WA","WV","WI","WY","DC",
 }
 
-def detect_country(location):
-    if not location:
-        return "Unknown"
-    loc = location.strip()
-
-    country_keywords = {
-        "United Kingdom": "UK", "United States": "USA", "Australia": "Australia",
-        "Canada": "Canada", "China": "China", "Japan": "Japan", "Germany": "Germany",
-        "France": "France", "Italy": "Italy", "Spain": "Spain", "India": "India",
-        "Singapore": "Singapore", "South Korea": "South Korea", "Brazil": "Brazil",
-        "Switzerland": "Switzerland", "Netherlands": "Netherlands",
-        "Sweden": "Sweden", "Denmark": "Denmark", "Finland": "Finland", "Norway": "Norway",
-        "Ireland": "Ireland", "Portugal": "Portugal", "Greece": "Greece",
-        "Israel": "Israel", "UAE": "UAE", "Saudi Arabia": "Saudi Arabia",
-        "Turkey": "Turkey", "Indonesia": "Indonesia", "Thailand": "Thailand",
-        "Taiwan": "Taiwan", "Vietnam": "Vietnam", "New Zealand": "New Zealand",
-        "Czech Republic": "Czech Republic", "Poland": "Poland", "Hungary": "Hungary",
-        "Austria": "Austria", "Belgium": "Belgium", "Korea": "South Korea",
-        "Mexico": "Mexico", "Chile": "Chile", "Iceland": "Iceland",
-    }
+COUNTRY_KEYWORDS = {
+    "United Kingdom": "UK", "United States": "USA", "Australia": "Australia",
+    "Canada": "Canada", "China": "China", "Japan": "Japan", "Germany": "Germany",
+    "France": "France", "Italy": "Italy", "Spain": "Spain", "India": "India",
+    "Singapore": "Singapore", "South Korea": "South Korea", "Brazil": "Brazil",
+    "Switzerland": "Switzerland", "Netherlands": "Netherlands",
+    "Sweden": "Sweden", "Denmark": "Denmark", "Finland": "Finland", "Norway": "Norway",
+    "Ireland": "Ireland", "Portugal": "Portugal", "Greece": "Greece",
+    "Israel": "Israel", "UAE": "UAE", "Saudi Arabia": "Saudi Arabia",
+    "Turkey": "Turkey", "Indonesia": "Indonesia", "Thailand": "Thailand",
+    "Taiwan": "Taiwan", "Vietnam": "Vietnam", "New Zealand": "New Zealand",
+    "Czech Republic": "Czech Republic", "Poland": "Poland", "Hungary": "Hungary",
+    "Austria": "Austria", "Belgium": "Belgium", "Korea": "South Korea",
+    "Mexico": "Mexico", "Chile": "Chile", "Iceland": "Iceland",
+}
+
+# Country names, then cities, lowercased; earlier entries take priority
+LOCATION_KEYWORDS = ([(k.lower(), c) for k, c in COUNTRY_KEYWORDS.items()]
+                     + [(k.lower(), c) for k, c in INTERNATIONAL_CITIES.items()])
+
 
-    for keyword, country in country_keywords.items():
-        if keyword.lower() in loc.lower():
-            return country
+def build_location_automaton():
+    """Aho-Corasick automaton mapping each location keyword to (priority, country)."""
+    automaton = ahocorasick.Automaton()
+    for rank, (keyword, country) in enumerate(LOCATION_KEYWORDS):
+        if keyword not in automaton:  # Duplicates keep the earlier (higher priority) rank
+            automaton.add_word(keyword, (rank, country))
+    automaton.make_automaton()
+    return automaton
 
-    for city, country in INTERNATIONAL_CITIES.items():
-        if city.lower() in loc.lower():
-            return country
 
-    for state in US_STATES:
-        if re.search(r'\b' + state + r'\b', loc):
-            return "USA"
+LOCATION_AUTOMATON = build_location_automaton() if ahocorasick else None
+# State codes are matched case-sensitively as whole words, so "Portland, OR" counts but "in" or "or" does not
+US_STATE_RE = re.compile(r'\b(?:' + '|'.join(sorted(US_STATES)) + r')\b')
+VIRTUAL_RE = re.compile(r'\b(virtual|online|zoom|remote)\b', re.IGNORECASE)
 
-    if re.search(r'\b(virtual|online|zoom|remote)\b', loc, re.IGNORECASE):
+
+def detect_country(location):
+    if not location:
+        return "Unknown"
+    # Cache on the stripped text only: US state codes are matched case-sensitively
+    return detect_country_cached(location.strip())
+
+
+@lru_cache(maxsize=4096)
+def detect_country_cached(loc):
+    loc_lower = loc.lower()
+    if LOCATION_AUTOMATON is not None:
+        # Every keyword/city in the location in one pass; the highest-priority one wins
+        hits = [value for _, value in LOCATION_AUTOMATON.iter(loc_lower)]
+        if hits:
+            return min(hits)[1]
+    else:
+        for keyword, country in LOCATION_KEYWORDS:
+            if keyword in loc_lower:
+                return country
+
+    if US_STATE_RE.search(loc):
+        return "USA"
+
+    if VIRTUAL_RE.search(loc):
         return "Virtual"
 
     return "Unknown"
 
 
+# Category substring -> tag ("econ" also covers "economics")
+CATEGORY_DISCIPLINES = {"finance": "fin", "accounting": "acct", "econ": "econ"}
+# Tag <- any of these words in the conference name
+NAME_DISCIPLINES = (
+    ("acct", ("accounting",)),
+    ("econ", ("economics", "economic", "macroeconom")),
+    ("fin", ("finance",)),
+)
+
+
 def detect_disciplines(category, name):
-    discs = set()
-    cat = category.lower()
-    nm = name.lower()
-    if "finance" in cat: discs.add("fin")
-    if "accounting" in cat: discs.add("acct")
-    if "economics" in cat or "econ" in cat: discs.add("econ")
-    if "accounting" in nm and "acct" not in discs: discs.add("acct")
-    if any(w in nm for w in ["economics", "economic", "macroeconom"]) and "econ" not in discs: discs.add("econ")
-    if "finance" in nm and "fin" not in discs: discs.add("fin")
-    return sorted(discs) if discs else ["fin"]
+    # A fresh list per call: merges append to the "disc" list this ends up in
+    return list(detect_disciplines_cached(category.lower(), name.lower()))
+
+
+@lru_cache(maxsize=4096)
+def detect_disciplines_cached(cat, nm):
+    discs = {tag for key, tag in CATEGORY_DISCIPLINES.items() if key in cat}
+    for tag, words in NAME_DISCIPLINES:
+        if tag not in discs and any(w in nm for w in words):
+            discs.add(tag)
+    return tuple(sorted(discs)) if discs else ("fin",)
 
 
 # --- SSRN Scraping ---
 
-def scrape_listing_page(page, network_name, network_id):
+# Listing entries that are plainly not conferences (jobs, journals, books)
+LISTING_SKIP_KEYWORDS = [
+    "phd", "doctoral position", "faculty position", "professor of",
+    "call for chapters", "special issue", "journal of", "edited book",
+    "tenure track", "research associate", "instructor", "lecturer",
+    "fellowship", "scholarship",
+]
+
+
+def build_skip_automaton():
+    """Aho-Corasick automaton over LISTING_SKIP_KEYWORDS."""
+    automaton = ahocorasick.Automaton()
+    for kw in LISTING_SKIP_KEYWORDS:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+LISTING_SKIP_AUTOMATON = build_skip_automaton() if ahocorasick else None
+
+
+def is_listing_skip(name_lower):
+    """True if a (lowercased) listing name contains any skip keyword."""
+    if LISTING_SKIP_AUTOMATON is not None:
+        return next(LISTING_SKIP_AUTOMATON.iter(name_lower), None) is not None
+    return any(kw in name_lower for kw in LISTING_SKIP_KEYWORDS)
+
+
+# Extract conference entries from a listing page: each <li> with an announcement link
+# under a conference-section heading (or, failing that, anywhere on the page). One
+# anchored regex classifies each <p> line instead of a startsWith/replace per field.
+LISTING_JS = r"""(confSections) => {
+    const FIELDS = {'Conference Dates:': 'dates', 'Date:': 'dates', 'Location:': 'location', 'Posted:': 'posted'};
+    const FIELD_RE = /^(Conference Dates:|Date:|Location:|Posted:)\s*/;
+    const readEntry = (li, link) => {
+        const entry = { name: link.textContent.trim(), href: link.href, dates: '', location: '', posted: '' };
+        for (const p of li.getElementsByTagName('p')) {
+            const text = p.textContent.trim();
+            const m = FIELD_RE.exec(text);
+            if (m) entry[FIELDS[m[1]]] = text.slice(m[0].length).trim();
+        }
+        const idMatch = link.href.match(/id=(\d+)/);
+        entry.sid = idMatch ? idMatch[1] : '';
+        return entry;
+    };
+
+    const results = [];
+    for (const heading of document.querySelectorAll('h4, h3')) {
+        const headingText = heading.textContent.trim();
+        if (!confSections.some(s => headingText.includes(s))) continue;
+        const list = heading.nextElementSibling;
+        if (!list || (list.tagName !== 'UL' && list.tagName !== 'OL')) continue;
+        for (const li of list.getElementsByTagName('li')) {
+            const link = li.querySelector('a[href*="/announcement/?id="]');
+            if (link) results.push(readEntry(li, link));
+        }
+    }
+    if (results.length === 0) {
+        for (const link of document.querySelectorAll('a[href*="/announcement/?id="]')) {
+            const li = link.closest('li');
+            if (li) results.push(readEntry(li, link));
+        }
+    }
+    return results;
+}"""
+
+
+async def scrape_listing_page(page, network_name, network_id):
     """Scrape one SSRN network listing page. All entries are on a single page."""
     url = f"https://www.ssrn.com/index.cfm/en/janda/professional-announcements/?annsNet={network_id}"
     log.info(f"  [{network_name}] Loading {url}")
 
     try:
-        page.goto(url, wait_until="networkidle", timeout=60000)
-        time.sleep(PAGE_DELAY)
+        await ssrn_bucket.acquire()
+        await page.goto(url, wait_until="networkidle", timeout=60000)
+        await asyncio.sleep(PAGE_DELAY)
     except Exception as e:
         log.warning(f"  [{network_name}] Page load failed: {e}")
         return []
 
     # Extract conference entries from the listing page HTML
-    entries = page.evaluate("""(confSections) => {
-        const results = [];
-        const headings = document.querySelectorAll('h4, h3');
-        headings.forEach(heading => {
-            const headingText = heading.textContent.trim();
-            const isConference = confSections.some(s => headingText.includes(s));
-            if (!isConference) return;
-            let nextEl = heading.nextElementSibling;
-            if (!nextEl || (nextEl.tagName !== 'UL' && nextEl.tagName !== 'OL')) return;
-            const items = nextEl.querySelectorAll('li');
-            items.forEach(li => {
-                const link = li.querySelector('a[href*="/announcement/?id="]');
-                if (!link) return;
-                const entry = { name: link.textContent.trim(), href: link.href, dates: '', location: '', posted: '' };
-                li.querySelectorAll('p').forEach(p => {
-                    const text = p.textContent.trim();
-                    if (text.startsWith('Conference Dates:') || text.startsWith('Date:'))
-                        entry.dates = text.replace(/^(Conference Dates:|Date:)\\s*/, '').trim();
-                    if (text.startsWith('Location:'))
-                        entry.location = text.replace('Location:', '').trim();
-                    if (text.startsWith('Posted:'))
-                        entry.posted = text.replace('Posted:', '').trim();
-                });
-                const idMatch = link.href.match(/id=(\\d+)/);
-                entry.sid = idMatch ? idMatch[1] : '';
-                results.push(entry);
-            });
-        });
-        if (results.length === 0) {
-            document.querySelectorAll('a[href*="/announcement/?id="]').forEach(link => {
-                const li = link.closest('li');
-                if (!li) return;
-                const entry = { name: link.textContent.trim(), href: link.href, dates: '', location: '', posted: '' };
-                li.querySelectorAll('p').forEach(p => {
-                    const text = p.textContent.trim();
-                    if (text.startsWith('Conference Dates:') || text.startsWith('Date:'))
-                        entry.dates = text.replace(/^(Conference Dates:|Date:)\\s*/, '').trim();
-                    if (text.startsWith('Location:'))
-                        entry.location = text.replace('Location:', '').trim();
-                    if (text.startsWith('Posted:'))
-                        entry.posted = text.replace('Posted:', '').trim();
-                });
-                const idMatch = link.href.match(/id=(\\d+)/);
-                entry.sid = idMatch ? idMatch[1] : '';
-                results.push(entry);
-            });
-        }
-        return results;
-    }""", CONFERENCE_SECTIONS)
+    entries = await page.evaluate(LISTING_JS, CONFERENCE_SECTIONS)
 
     conferences = []
     for entry in entries:
-        name_lower = entry["name"].lower()
-        skip_keywords = [
-            "phd", "doctoral position", "faculty position", "professor of",
-            "call for chapters", "special issue", "journal of", "edited book",
-            "tenure track", "research associate", "instructor", "lecturer",
-            "fellowship", "scholarship",
-        ]
-        if any(kw in name_lower for kw in skip_keywords):
+        if is_listing_skip(entry["name"].lower()):
             continue
         entry["category"] = network_name
         entry["ssrnLink"] = entry.pop("href")
@@ -480,6 +650,19 @@ def scrape_listing_page(page, network_name, network_id):
     return conferences
 
 
+async def scrape_listing_pages(pool):
+    """Load every NETWORKS listing at once, one pool page each. Entries come back in NETWORKS order."""
+    async def scrape_network(name, nid):
+        page = await pool.acquire()
+        try:
+            return await scrape_listing_page(page, name, nid)
+        finally:
+            pool.release(page)
+
+    per_network = await asyncio.gather(*(scrape_network(name, nid) for name, nid in NETWORKS.items()))
+    return [c for confs in per_network for c in confs]
+
+
 CONF_DATE_PATTERNS = [
     # "Conference Date(s): 11 Jul 2026" or "Conference Date: July 11-12, 2026"
     r"[Cc]onference\s+[Dd]ates?\s*[:\-]\s*(\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4}(?:\s*[-–]\s*\d{1,2}(?:st|nd|rd|th)?\s+\w+\s+\d{4})?)",
@@ -501,11 +684,13 @@ CONF_DATE_PATTERNS = [
     r"scheduled\s+for\s+(\d{1,2}(?:st|nd|rd|th)?\s+\w+,?\s+\d{4})",
 ]
 
+CONF_DATE_RES = [compile_linear(p, "im") for p in CONF_DATE_PATTERNS]
+
 
-def extract_conf_date_from_text(text):
+def extract_conf_date_from_text(text, conf_date_res=CONF_DATE_RES):
     """Extract conference date from detail page text. Returns (startDate, displayDates) or (None, None)."""
-    for pattern in CONF_DATE_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+    for rx in conf_date_res:
+        match = rx.search(text)
         if match:
             raw = match.group(1).strip()
             start_date, display = parse_conf_dates(raw)
@@ -521,55 +706,579 @@ def extract_conf_date_from_text(text):
     return (None, None)
 
 
-def scrape_detail_page(page, url):
+def build_date_pattern_set():
+    """
+    One RE2::Set over every deadline, no-year and conference-date pattern. A single
+    linear sweep of the page reports which patterns match anywhere; the extractors
+    then only re-run those, still in priority order. None without RE2 (or if RE2
+    rejects a pattern), in which case every pattern is tried as before. Like the
+    RE2-compiled patterns, the set only agrees with re on text whose Unicode spaces
+    were rewritten by SPACE_LIKE_RE, which extract_dates_from_text does first.
+    """
+    if re2 is None:
+        return None
+    pattern_set = re2.Set.SearchSet()
+    try:
+        for p in DEADLINE_PATTERNS + NO_YEAR_PATTERNS:
+            pattern_set.Add(f"(?i){p}")
+        for p in CONF_DATE_PATTERNS:
+            pattern_set.Add(f"(?im){p}")
+        pattern_set.Compile()
+    except re2.error:
+        return None
+    return pattern_set
+
+
+DATE_PATTERN_SET = build_date_pattern_set()
+
+# Whitespace other than spaces and newlines: NBSP (innerText keeps &nbsp; as U+00A0),
+# thin spaces, tabs. RE2's \s, \w and \b are ASCII-only, so "March\xa05, 2026" only
+# matches there once these are plain spaces; re's \s already treats them as spaces.
+SPACE_LIKE_RE = re.compile(r"[^\S\n ]")
+
+
+def extract_dates_from_text(text):
+    """Deadline and (startDate, displayDates) from one detail page, scanning it once up front."""
+    text = SPACE_LIKE_RE.sub(" ", text)
+    if DATE_PATTERN_SET is None:
+        return extract_deadline_from_text(text), extract_conf_date_from_text(text)
+
+    hits = set(DATE_PATTERN_SET.Match(text) or ())
+    d, n = len(DEADLINE_RES), len(NO_YEAR_RES)
+    deadline_res = [rx for i, rx in enumerate(DEADLINE_RES) if i in hits]
+    no_year_res = [rx for i, rx in enumerate(NO_YEAR_RES, d) if i in hits]
+    conf_date_res = [rx for i, rx in enumerate(CONF_DATE_RES, d + n) if i in hits]
+    return (
+        extract_deadline_from_text(text, deadline_res, no_year_res),
+        extract_conf_date_from_text(text, conf_date_res),
+    )
+
+
+def extract_detail_dates(text, page_text):
+    """
+    extract_dates_from_text on the announcement container's text, with whatever it
+    misses looked up in the whole page: DETAIL_BODY_SELECTOR can match a container
+    that leaves out the "Date:" or deadline block.
+    """
+    deadline, conf_date = extract_dates_from_text(text)
+    if (not deadline or not conf_date[0]) and page_text != text:
+        page_deadline, page_conf_date = extract_dates_from_text(page_text)
+        deadline = deadline or page_deadline
+        if not conf_date[0]:
+            conf_date = page_conf_date
+    return deadline, conf_date
+
+
+# Containers that hold the announcement text on SSRN's server-rendered detail pages
+DETAIL_BODY_SELECTOR = "#announcementContent, .announcement-content, article, main"
+
+# [container text, whole-page text]: innerText of the announcement container only
+# (no nav, footer, related-paper lists), and of the body for extract_detail_dates to
+# fall back on. Without a container both are the body. querySelector returns the first
+# match in document order, so an outer <main> wins over an inner <article>.
+DETAIL_TEXT_JS = """(selector) => {
+    const page = document.body ? document.body.innerText : '';
+    const el = document.querySelector(selector);
+    return [el ? el.innerText : page, page];
+}"""
+
+
+# With the right selector the container is there at DOMContentLoaded, so this can be
+# short: a miss then costs it plus networkidle, less than the networkidle + 3 s every
+# page used to wait.
+DETAIL_BODY_TIMEOUT_MS = 2000
+detail_selector_missed = False  # A miss is logged once per run, so a wrong selector shows up
+
+
+async def wait_for_detail_body(page):
+    """The text is in the DOM at DOMContentLoaded; wait for its container, not for the network."""
+    global detail_selector_missed
+    try:
+        await page.wait_for_selector(DETAIL_BODY_SELECTOR, timeout=DETAIL_BODY_TIMEOUT_MS)
+    except Exception:
+        if not detail_selector_missed:
+            detail_selector_missed = True
+            log.warning(f"    No {DETAIL_BODY_SELECTOR!r} on {page.url}; "
+                        f"falling back to networkidle and the whole page")
+        # Unfamiliar layout: fall back to letting the network settle
+        await page.wait_for_load_state("networkidle")
+
+
+# Text of Cloudflare's interstitial; compiled once and handed to the text locator
+CLOUDFLARE_RE = re.compile(r"Cloudflare|security verification")
+
+
+async def cloudflare_blocked(page):
+    """Check for the Cloudflare challenge in the browser rather than copying out the whole DOM."""
+    return await page.get_by_text(CLOUDFLARE_RE).count() > 0
+
+
+async def scrape_detail_page(page, url):
     """Visit one SSRN announcement page and extract deadline + conference dates."""
     try:
-        page.goto(url, wait_until="networkidle", timeout=30000)
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(3000)
-        
-        # Check for Cloudflare
-        content = page.content()
-        if "Cloudflare" in content or "security verification" in content:
+        await ssrn_bucket.acquire()
+        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        await wait_for_detail_body(page)
+
+        if await cloudflare_blocked(page):
             log.warning(f"    Cloudflare detected on {url}. Waiting and retrying...")
-            page.wait_for_timeout(8000)
-            page.reload(wait_until="networkidle")
-            page.wait_for_timeout(3000)
-            content = page.content()
-            if "Cloudflare" in content or "security verification" in content:
+            await page.wait_for_timeout(8000)
+            await ssrn_bucket.acquire()
+            await page.reload(wait_until="domcontentloaded")
+            await wait_for_detail_body(page)
+            if await cloudflare_blocked(page):
                 log.error(f"    Cloudflare block persisted after retry on {url}")
-                return {"deadline": None, "conf_date": (None, None)}
+                return {"deadline": None, "conf_date": (None, None), "loaded": False}
 
     except Exception as e:
         log.warning(f"    Page load failed for {url}: {e}")
-        return {"deadline": None, "conf_date": (None, None)}
+        return {"deadline": None, "conf_date": (None, None), "loaded": False}
 
-    full_text = page.evaluate("() => document.body ? document.body.innerText : ''")
-    time.sleep(random.uniform(2, 5))
-    
-    deadline = extract_deadline_from_text(full_text)
-    conf_date = extract_conf_date_from_text(full_text)
+    text, page_text = await page.evaluate(DETAIL_TEXT_JS, DETAIL_BODY_SELECTOR)
+    deadline, conf_date = extract_detail_dates(text, page_text)
     
-    return {"deadline": deadline, "conf_date": conf_date}
+    return {"deadline": deadline, "conf_date": conf_date, "loaded": True}
+
+
+CONTEXT_OPTIONS = {
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+}
+# Runs before any page script in every page of the context
+STEALTH_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+def is_blocked_request(request):
+    """True for asset types and third-party hosts the scraper never reads."""
+    if request.resource_type in BLOCKED_RESOURCE_TYPES:
+        return True
+    url = urlparse(request.url)
+    return url.scheme in ("http", "https") and not ("." + (url.hostname or "")).endswith(ALLOWED_HOSTS)
+
+
+async def block_unneeded(route):
+    if is_blocked_request(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def launch_context(p):
+    """
+    Persistent Chromium context in PROFILE_DIR, so SSRN's Cloudflare clearance
+    cookies survive from one run to the next. STEALTH_JS and block_unneeded
+    are registered once here and apply to every page of the context.
+    """
+    ctx = await p.chromium.launch_persistent_context(
+        str(PROFILE_DIR.absolute()), headless=True, **CONTEXT_OPTIONS)
+    await ctx.add_init_script(STEALTH_JS)
+    await ctx.route("**/*", block_unneeded)
+    return ctx
 
 
-def scrape_deadline_from_page(page, url):
-    """Legacy wrapper — returns just the deadline."""
-    result = scrape_detail_page(page, url)
-    return result["deadline"]
+class TokenBucket:
+    """
+    Request budget shared by everything that talks to SSRN: on average `rate`
+    requests per second, with bursts of up to `burst`. acquire() only sleeps
+    once the budget is spent, so time already spent loading and parsing pages
+    counts toward the spacing instead of being added on top of it.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.stamp = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+            self.stamp = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0
+            self.stamp = time.monotonic()
+
+
+ssrn_bucket = TokenBucket(SSRN_REQUESTS_PER_SECOND, DETAIL_WORKERS)
+
+
+class PagePool:
+    """
+    Open pages of one browser context, handed back after use so the listing
+    phase's pages become detail workers instead of being closed and reopened.
+    Closing the pool closes the context and with it every page.
+    """
+
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.idle = []
+
+    async def acquire(self):
+        return self.idle.pop() if self.idle else await self.ctx.new_page()
+
+    def release(self, page):
+        self.idle.append(page)
+
+    async def close(self):
+        await self.ctx.close()
+
+
+# Elements innerText starts on a new line
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header",
+    "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "td", "th", "tr", "ul",
+})
+# Elements whose text is never rendered
+HIDDEN_TAGS = frozenset({"head", "script", "style", "noscript", "template"})
+WHITESPACE_RE = re.compile(r"\s+")
+SPACES_RE = re.compile(r" {2,}")
+BLOCK_BREAK_RE = re.compile(r" *\n\s*")
+
+
+class AnnouncementText(HTMLParser):
+    """
+    Roughly what DETAIL_TEXT_JS returns, from raw HTML: the text of the first
+    element matching DETAIL_BODY_SELECTOR (else the whole page) and of the whole
+    page, one line per block.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.page, self.body = [], []
+        self.hidden = 0
+        self.container = None  # Tag name of the matched container, while inside it
+        self.nesting = 0
+        self.found = False
+
+    def is_container(self, tag, attrs):
+        attrs = dict(attrs)
+        return (tag in ("article", "main") or attrs.get("id") == "announcementContent"
+                or "announcement-content" in (attrs.get("class") or "").split())
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HIDDEN_TAGS:
+            self.hidden += 1
+        if self.container == tag:
+            self.nesting += 1
+        elif not self.found and self.is_container(tag, attrs):
+            self.container, self.nesting, self.found = tag, 1, True
+        if tag in BLOCK_TAGS:
+            self.add("\n")
+
+    def handle_endtag(self, tag):
+        if tag in HIDDEN_TAGS and self.hidden:
+            self.hidden -= 1
+        if tag in BLOCK_TAGS:
+            self.add("\n")
+        if self.container == tag:
+            self.nesting -= 1
+            if not self.nesting:
+                self.container = None
+
+    def handle_data(self, data):
+        if not self.hidden:
+            self.add(WHITESPACE_RE.sub(" ", data))
+
+    def add(self, text):
+        self.page.append(text)
+        if self.container:
+            self.body.append(text)
+
+    @staticmethod
+    def join(chunks):
+        return BLOCK_BREAK_RE.sub("\n", SPACES_RE.sub(" ", "".join(chunks))).strip()
+
+    def texts(self):
+        page = self.join(self.page)
+        return (self.join(self.body) if self.found else page), page
+
+
+def html_to_texts(html):
+    """(container text, whole-page text) of a detail page, as DETAIL_TEXT_JS returns them."""
+    parser = AnnouncementText()
+    parser.feed(html)
+    parser.close()
+    return parser.texts()
+
+
+def open_http_cache(path):
+    """Open the conditional-GET cache, dropping pages not seen for HTTP_CACHE_TTL_DAYS."""
+    cache = sqlite3.connect(path)
+    columns = {row[1] for row in cache.execute("PRAGMA table_info(pages)")}
+    if columns and "page_text" not in columns:
+        cache.execute("DROP TABLE pages")  # Written before the whole-page text was kept
+    cache.execute("CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, etag TEXT, "
+                  "last_modified TEXT, text TEXT, page_text TEXT, ts REAL)")
+    cache.execute("DELETE FROM pages WHERE ts < ?", (time.time() - HTTP_CACHE_TTL_DAYS * 86400,))
+    cache.commit()
+    return cache
+
+
+async def stay_on_ssrn(request):
+    """Request hook: refuse redirects off ssrn.com, which count as a failed fetch."""
+    if not ("." + request.url.host).endswith(".ssrn.com"):
+        raise httpx.RequestError(f"redirected off SSRN to {request.url.host}", request=request)
+
+
+class HttpFetcher:
+    """
+    Detail pages over plain HTTP (keep-alive, no rendering) with the browser's
+    cookies and user agent, so a cleared Cloudflare session carries over. After
+    HTTP_FAILURE_LIMIT failures in a row it stays closed for the rest of the run.
+    Pages that sent a validator are re-requested conditionally; a 304 reuses the
+    text stored in the cache without downloading or parsing the page again.
+    """
+
+    def __init__(self, cookies, cache):
+        self.cache = cache
+        # Keep each cookie's domain and path so they only go where the browser would send them
+        jar = httpx.Cookies()
+        for c in cookies:
+            jar.set(c["name"], c["value"], domain=c["domain"], path=c["path"])
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": CONTEXT_OPTIONS["user_agent"], "Accept-Language": "en-US,en;q=0.9"},
+            cookies=jar,
+            follow_redirects=True,
+            event_hooks={"request": [stay_on_ssrn]},
+            http2=h2 is not None,
+            timeout=30,
+            limits=httpx.Limits(max_connections=DETAIL_WORKERS),
+        )
+        self.failures = 0
+
+    @property
+    def open(self):
+        return self.failures < HTTP_FAILURE_LIMIT
+
+    async def fetch_texts(self, url):
+        """
+        (announcement text, whole-page text) of url, or None if the request failed
+        or got the challenge page.
+        """
+        row = self.cache.execute(
+            "SELECT etag, last_modified, text, page_text FROM pages WHERE url = ?", (url,)).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers["If-None-Match"] = row[0]
+        if row and row[1]:
+            headers["If-Modified-Since"] = row[1]
+        try:
+            await ssrn_bucket.acquire()
+            resp = await self.client.get(url, headers=headers)
+            if resp.status_code == 304 and row:
+                texts = row[2], row[3]
+                self.cache.execute("UPDATE pages SET ts = ? WHERE url = ?", (time.time(), url))
+                self.cache.commit()
+            elif resp.status_code == 200:
+                texts = html_to_texts(resp.text)
+                self.store(url, resp, texts)
+            else:
+                texts = None
+        except httpx.HTTPError as e:
+            log.debug(f"    HTTP fetch failed for {url}: {e}")
+            texts = None
+        if texts is None or CLOUDFLARE_RE.search(texts[0]):
+            self.failures += 1
+            if self.failures == HTTP_FAILURE_LIMIT:
+                log.info(f"  Plain HTTP failed {self.failures} times in a row; using the browser only")
+            return None
+        self.failures = 0
+        return texts
+
+    def store(self, url, resp, texts):
+        etag, last_modified = resp.headers.get("etag"), resp.headers.get("last-modified")
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with next time
+        self.cache.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                           (url, etag, last_modified, *texts, time.time()))
+        self.cache.commit()
+
+    async def close(self):
+        await self.client.aclose()
+        self.cache.close()
+
+
+async def fetch_detail_fast(fetcher, url):
+    """scrape_detail_page's result without the browser, or None to send the page to Playwright."""
+    texts = await fetcher.fetch_texts(url)
+    if texts is None:
+        return None
+    deadline, conf_date = extract_detail_dates(*texts)
+    if not deadline and not conf_date[0]:
+        return None  # Nothing found: maybe rendered client-side, let the browser look
+    return {"deadline": deadline, "conf_date": conf_date, "loaded": True}
+
+
+def load_detail_cache():
+    if not DETAIL_CACHE_PATH.exists():
+        return {}
+    try:
+        if orjson is not None:
+            return orjson.loads(DETAIL_CACHE_PATH.read_bytes())
+        with open(DETAIL_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        log.warning(f"  Ignoring unreadable {DETAIL_CACHE_PATH}: {e}")
+        return {}
+
+
+def detail_cache_expired(entry):
+    return (date.today() - date.fromisoformat(entry["fetched"])).days >= DETAIL_CACHE_TTL_DAYS
+
+
+def save_detail_cache(cache):
+    """
+    Write the unexpired entries through a temp file and rename, like save_existing_json,
+    so an interrupted save never truncates the cache.
+    """
+    cache = {sid: entry for sid, entry in cache.items() if not detail_cache_expired(entry)}
+    tmp = DETAIL_CACHE_PATH.with_name(DETAIL_CACHE_PATH.name + ".tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(cache))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, ensure_ascii=False)
+    os.replace(tmp, DETAIL_CACHE_PATH)
+
+
+def cached_detail(entry, posted):
+    """
+    The cached scrape_detail_page result, unless it is stale, the listing shows a newer
+    post, or no deadline was found (still TBD, so every run looks again).
+    """
+    if not entry or not entry.get("deadline"):
+        return None
+    if posted and entry.get("posted") and posted != entry["posted"]:
+        return None
+    if detail_cache_expired(entry):
+        return None
+    return {"deadline": entry["deadline"], "conf_date": tuple(entry["conf_date"]), "loaded": True}
+
+
+async def scrape_detail_pages(pool, urls, posted=None):
+    """
+    Visit {sid: url} with DETAIL_WORKERS pages in parallel.
+    Returns {sid: scrape_detail_page result}. Pages fetched within DETAIL_CACHE_TTL_DAYS
+    are answered from DETAIL_CACHE_PATH; posted ({sid: listing "Posted:" text})
+    invalidates entries SSRN has re-posted since.
+    """
+    posted = posted or {}
+    cache = load_detail_cache()
+    results = {}
+    for sid in urls:
+        hit = cached_detail(cache.get(sid), posted.get(sid))
+        if hit:
+            results[sid] = hit
+    queue = deque((sid, url) for sid, url in urls.items() if sid not in results)
+    if results:
+        log.info(f"  {len(results)} detail pages cached, {len(queue)} to visit")
+
+    unsaved = 0  # Pages cached since the last save_detail_cache
+    fetcher = None
+    if httpx is not None and queue:
+        fetcher = HttpFetcher(await pool.ctx.cookies(), open_http_cache(HTTP_CACHE_PATH))
+
+    async def worker():
+        nonlocal unsaved
+        page = await pool.acquire()
+        try:
+            while queue:
+                sid, url = queue.popleft()
+                result = None
+                if fetcher is not None and fetcher.open:
+                    result = await fetch_detail_fast(fetcher, url)
+                if result is None:
+                    result = await scrape_detail_page(page, url)
+                results[sid] = result
+                # Only cache pages that actually loaded; a blocked page is retried next run
+                if result["loaded"]:
+                    cache[sid] = {
+                        "fetched": date.today().isoformat(),
+                        "posted": posted.get(sid, ""),
+                        "deadline": result["deadline"],
+                        "conf_date": result["conf_date"],
+                    }
+                    unsaved += 1
+                    if unsaved >= DETAIL_CACHE_SAVE_EVERY:
+                        save_detail_cache(cache)
+                        unsaved = 0
+                if len(results) % 20 == 0:
+                    log.info(f"  Progress: {len(results)}/{len(urls)}...")
+        finally:
+            pool.release(page)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(DETAIL_WORKERS, len(queue)))))
+    finally:
+        if unsaved:
+            save_detail_cache(cache)
+        if fetcher is not None:
+            await fetcher.close()
+    return results
 
 
 # --- Main Pipeline ---
 
 def load_existing_json():
-    if JSON_PATH.exists():
-        with open(JSON_PATH, encoding="utf-8") as f:
-            return json.load(f)
-    return []
+    if not JSON_PATH.exists():
+        return []
+    if orjson is not None:
+        return orjson.loads(JSON_PATH.read_bytes())
+    with open(JSON_PATH, encoding="utf-8") as f:
+        return json.load(f)
 
 
-def merge_scraped_into_existing(existing, scraped):
-    existing_by_sid = {str(c.get("sid", "")): c for c in existing}
+def save_existing_json(conferences):
+    """
+    Write to a temp file beside JSON_PATH and rename it over the original, so an
+    interrupted save never leaves a truncated conferences.json. orjson's OPT_INDENT_2
+    output is byte-identical to json.dump(indent=2, ensure_ascii=False).
+    """
+    tmp = JSON_PATH.with_name(JSON_PATH.name + ".tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(conferences, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(conferences, f, indent=2, ensure_ascii=False)
+    os.replace(tmp, JSON_PATH)
+
+
+def dedupe_by_sid(scraped):
+    """
+    {sid: entry} keeping the first listing of each announcement. An entry listed
+    under several networks gets every network in its category, comma-joined in
+    the order first seen.
+    """
+    seen = {}
+    categories = {}
+    for c in scraped:
+        sid = c["sid"]
+        if sid not in seen:
+            seen[sid] = c
+            categories[sid] = [c["category"]]
+        elif c["category"] not in categories[sid]:
+            categories[sid].append(c["category"])
+    for sid, cats in categories.items():
+        if len(cats) > 1:
+            seen[sid]["category"] = ",".join(cats)
+    return seen
+
+
+def merge_scraped_into_existing(existing, scraped, existing_by_sid=None):
+    """
+    Update existing entries from an iterable of scraped ones and append the new ones.
+    Callers that already index existing by str(sid) pass it in; new entries are added to it.
+    """
+    if existing_by_sid is None:
+        existing_by_sid = {str(c.get("sid", "")): c for c in existing}
     next_id = max((c.get("id", 0) for c in existing), default=0) + 1
     new_count = 0
     updated_count = 0
@@ -600,9 +1309,9 @@ def merge_scraped_into_existing(existing, scraped):
             if s.get("location") and not ex.get("location"):
                 ex["location"] = s["location"]
                 ex["country"] = detect_country(s["location"])
-            for d in detect_disciplines(s.get("category", ""), s.get("name", "")):
-                if d not in ex.get("disc", []):
-                    ex.setdefault("disc", []).append(d)
+            # detect_disciplines never returns an empty list, so the key was always set anyway
+            disc = ex.setdefault("disc", [])
+            disc.extend(d for d in detect_disciplines(s.get("category", ""), s.get("name", "")) if d not in disc)
         else:
             start_date, display_dates = parse_conf_dates(s.get("dates", ""))
             # Prefer detail-page dates over listing dates
@@ -635,101 +1344,93 @@ def merge_scraped_into_existing(existing, scraped):
     return existing
 
 
-def run_full_scrape():
-    from playwright.sync_api import sync_playwright
+def count_statuses(conferences):
+    """(deadline set, deadline TBD, tiered) counts for the end-of-run summary, in one pass."""
+    dl_set = tbd = tiered = 0
+    for c in conferences:
+        deadline = c.get("deadline")
+        if deadline and deadline != "TBD":
+            dl_set += 1
+        else:
+            tbd += 1
+        if c.get("tier"):
+            tiered += 1
+    return dl_set, tbd, tiered
 
-    existing = load_existing_json()
-    existing_sids = {str(c.get("sid", "")) for c in existing}
-    log.info(f"Loaded {len(existing)} existing conferences")
 
-    all_scraped = []
+async def run_full_scrape():
+    from playwright.async_api import async_playwright
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        ctx = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-        page = ctx.new_page()
-        page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    existing = load_existing_json()
+    log.info(f"Loaded {len(existing)} existing conferences")
 
+    # One pass over the file: sid lookup, plus which entries need their page revisited.
+    # existing_by_sid keeps the last entry per sid, as merge_scraped_into_existing always
+    # has; Phase 2 updates the first entry per sid (the first TBD one for deadlines).
+    existing_by_sid = {}
+    first_by_sid = {}
+    first_tbd_by_sid = {}
+    tbd_sids = set()
+    tbd_urls = {}
+    vague_date_sids = set()
+    for c in existing:
+        sid = str(c.get("sid", ""))
+        existing_by_sid[sid] = c
+        first_by_sid.setdefault(sid, c)
+        if not c.get("deadline") or c["deadline"] == "TBD":
+            tbd_sids.add(sid)
+            first_tbd_by_sid.setdefault(sid, c)
+            if c.get("ssrnLink"):
+                tbd_urls[sid] = c["ssrnLink"]
+        # Vague = no startDate, or startDate ends in -01 (likely month-only guess)
+        start = c.get("startDate", "")
+        if sid and (not start or start.endswith("-01")):
+            vague_date_sids.add(sid)
+
+    async with async_playwright() as p:
+        pool = PagePool(await launch_context(p))
 
         # Phase 1: Listing pages
         log.info("\n=== PHASE 1: Scraping listing pages ===")
-        for name, nid in NETWORKS.items():
-            confs = scrape_listing_page(page, name, nid)
-            all_scraped.extend(confs)
-            time.sleep(random.uniform(2, 5))
-
+        all_scraped = await scrape_listing_pages(pool)
 
         # Deduplicate by SID
-        seen = {}
-        for c in all_scraped:
-            sid = c["sid"]
-            if sid not in seen:
-                seen[sid] = c
-            else:
-                old_cat = seen[sid].get("category", "")
-                if c["category"] not in old_cat:
-                    seen[sid]["category"] = old_cat + "," + c["category"]
-        all_scraped = list(seen.values())
+        seen = dedupe_by_sid(all_scraped)
 
-        log.info(f"\nTotal unique: {len(all_scraped)}")
-        new_entries = [c for c in all_scraped if str(c["sid"]) not in existing_sids]
-        log.info(f"New (not in JSON): {len(new_entries)}")
+        log.info(f"\nTotal unique: {len(seen)}")
+        new_sids = {str(sid) for sid in seen if str(sid) not in existing_by_sid}
+        log.info(f"New (not in JSON): {len(new_sids)}")
 
-        # Phase 2: Visit pages for deadlines
+        # Phase 2: Visit pages for deadlines, plus conferences with vague/missing dates
         log.info("\n=== PHASE 2: Scraping deadlines ===")
-        tbd_sids = {str(c.get("sid", "")) for c in existing if not c.get("deadline") or c["deadline"] == "TBD"}
-        new_sids = {str(c["sid"]) for c in new_entries}
-        sids_to_visit = new_sids | tbd_sids
-
-        sid_to_url = {}
-        for c in all_scraped:
-            sid_to_url[c["sid"]] = c["ssrnLink"]
-        for c in existing:
-            sid = str(c.get("sid", ""))
-            if sid in tbd_sids and c.get("ssrnLink"):
-                sid_to_url[sid] = c["ssrnLink"]
-
-        # Also visit pages for conferences with vague/missing dates
-        vague_date_sids = set()
-        for c in existing:
-            sid = str(c.get("sid", ""))
-            if not sid: continue
-            start = c.get("startDate", "")
-            # Vague = no startDate, or startDate ends in -01 (likely month-only guess)
-            if not start or start.endswith("-01"):
-                vague_date_sids.add(sid)
-        
-        sids_to_visit = sids_to_visit | vague_date_sids
+        sids_to_visit = new_sids | tbd_sids | vague_date_sids
         log.info(f"Pages to visit: {len(sids_to_visit)} ({len(new_sids)} new + {len(tbd_sids)} TBD deadlines + {len(vague_date_sids)} vague dates)")
 
-        visited = 0
+        # Listing links, overridden by the stored link of existing TBD entries
+        sid_to_url = {sid: c["ssrnLink"] for sid, c in seen.items() if c["ssrnLink"]}
+        sid_to_url.update(tbd_urls)
+        linked = sids_to_visit & sid_to_url.keys()
+        if len(linked) < len(sids_to_visit):
+            log.info(f"  Skipping {len(sids_to_visit) - len(linked)} with no SSRN link")
+        to_visit = {sid: sid_to_url[sid] for sid in linked}
+
+        # The detail workers reuse the listing pages from the pool
+        posted = {sid: c.get("posted", "") for sid, c in seen.items()}
+        results = await scrape_detail_pages(pool, to_visit, posted)
+
+        visited = len(results)
         deadlines_found = 0
         dates_found = 0
-        
-        for sid in sids_to_visit:
-            url = sid_to_url.get(sid)
-            if not url: continue
-
-            visited += 1
-            if visited % 20 == 0:
-                log.info(f"  Progress: {visited}/{len(sids_to_visit)}...")
 
-            result = scrape_detail_page(page, url)
-            
+        for sid, result in results.items():
             if result["deadline"]:
                 deadlines_found += 1
                 if sid in seen:
                     seen[sid]["deadline"] = result["deadline"]
                     log.info(f"  Deadline: {seen[sid]['name'][:50]} -> {result['deadline']}")
-                for c in existing:
-                    if str(c.get("sid", "")) == sid and (not c.get("deadline") or c["deadline"] == "TBD"):
-                        c["deadline"] = result["deadline"]
-                        break
+                c = first_tbd_by_sid.get(sid)
+                if c is not None:
+                    c["deadline"] = result["deadline"]
             
             conf_start, conf_display = result["conf_date"]
             if conf_start:
@@ -740,35 +1441,31 @@ def run_full_scrape():
                     seen[sid]["conf_display"] = conf_display
                     log.info(f"  Conf date: {seen[sid]['name'][:50]} -> {conf_start} ({conf_display})")
                 # Update in existing entries (if vague)
-                for c in existing:
-                    if str(c.get("sid", "")) == sid:
-                        old_start = c.get("startDate", "")
-                        if not old_start or old_start.endswith("-01"):
-                            c["startDate"] = conf_start
-                            if conf_display:
-                                c["dates"] = conf_display
-                            log.info(f"  Updated existing: {c['name'][:50]} startDate -> {conf_start}")
-                        break
+                c = first_by_sid.get(sid)
+                if c is not None:
+                    old_start = c.get("startDate", "")
+                    if not old_start or old_start.endswith("-01"):
+                        c["startDate"] = conf_start
+                        if conf_display:
+                            c["dates"] = conf_display
+                        log.info(f"  Updated existing: {c['name'][:50]} startDate -> {conf_start}")
 
         log.info(f"\nPhase 2: visited {visited}, found {deadlines_found} deadlines, {dates_found} conference dates")
-        browser.close()
+        await pool.close()
 
     # Phase 3: Merge and save
     log.info("\n=== PHASE 3: Merge and save ===")
-    result = merge_scraped_into_existing(existing, list(seen.values()))
+    result = merge_scraped_into_existing(existing, seen.values(), existing_by_sid)
 
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    save_existing_json(result)
 
-    dl_set = sum(1 for c in result if c.get("deadline") and c["deadline"] != "TBD")
-    tbd = sum(1 for c in result if not c.get("deadline") or c["deadline"] == "TBD")
-    tiered = sum(1 for c in result if c.get("tier"))
+    dl_set, tbd, tiered = count_statuses(result)
     log.info(f"\nSaved {len(result)} conferences to {JSON_PATH}")
     log.info(f"Deadlines set: {dl_set} | TBD: {tbd} | Tiered: {tiered}")
 
 
-def run_deadlines_only():
-    from playwright.sync_api import sync_playwright
+async def run_deadlines_only():
+    from playwright.async_api import async_playwright
 
     existing = load_existing_json()
     tbd_confs = [c for c in existing if not c.get("deadline") or c["deadline"] == "TBD"]
@@ -778,148 +1475,108 @@ def run_deadlines_only():
         log.info("No TBD deadlines to check!")
         return
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        ctx = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-        page = ctx.new_page()
-        page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-        found = 0
-        for i, conf in enumerate(tbd_confs):
-            if (i + 1) % 20 == 0:
-                log.info(f"  Progress: {i+1}/{len(tbd_confs)}...")
-            url = conf.get("ssrnLink", "")
-            if not url: continue
-            
-            deadline = scrape_deadline_from_page(page, url)
-            
-            if deadline:
-                conf["deadline"] = deadline
-                found += 1
-                log.info(f"  Found: {conf['name'][:50]} -> {deadline}")
-            
-            time.sleep(random.uniform(3, 7))
-
-
-        browser.close()
+    # One visit per announcement, shared by entries that repeat a sid; entries
+    # without a sid are keyed by their link so they never share a result
+    def visit_key(conf):
+        return str(conf.get("sid", "")) or conf["ssrnLink"]
+
+    to_visit = {}
+    for c in tbd_confs:
+        if c.get("ssrnLink"):
+            to_visit.setdefault(visit_key(c), c["ssrnLink"])
+
+    async with async_playwright() as p:
+        pool = PagePool(await launch_context(p))
+        results = await scrape_detail_pages(pool, to_visit)
+        await pool.close()
+
+    # Applied after the workers finish, in file order, so the log reads as before
+    found = 0
+    for conf in tbd_confs:
+        if not conf.get("ssrnLink"):
+            continue
+        result = results.get(visit_key(conf))
+        if result and result["deadline"]:
+            conf["deadline"] = result["deadline"]
+            found += 1
+            log.info(f"  Found: {conf['name'][:50]} -> {result['deadline']}")
 
     log.info(f"\nFound {found} deadlines out of {len(tbd_confs)} checked")
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(existing, f, indent=2, ensure_ascii=False)
+    save_existing_json(existing)
     log.info(f"Saved to {JSON_PATH}")
 
 
-def run_new_only():
+async def run_new_only():
     """Check for new conferences only. Fast daily mode.
     1. Scrapes 3 listing pages (~30 sec)
     2. Finds new conferences not in JSON
     3. Visits only those pages for deadlines
     4. Adds them to JSON
     """
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
 
     existing = load_existing_json()
-    existing_sids = {str(c.get("sid", "")) for c in existing}
+    existing_by_sid = {str(c.get("sid", "")): c for c in existing}
     log.info(f"Loaded {len(existing)} existing conferences")
 
-    all_scraped = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        ctx = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-        page = ctx.new_page()
-        page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
+    async with async_playwright() as p:
+        pool = PagePool(await launch_context(p))
 
         # Phase 1: Scrape listing pages
         log.info("\n=== Checking for new conferences ===")
-        for name, nid in NETWORKS.items():
-            confs = scrape_listing_page(page, name, nid)
-            all_scraped.extend(confs)
-            time.sleep(random.uniform(2, 5))
+        all_scraped = await scrape_listing_pages(pool)
 
         # Deduplicate
-        seen = {}
-        for c in all_scraped:
-            sid = c["sid"]
-            if sid not in seen:
-                seen[sid] = c
-            else:
-                old_cat = seen[sid].get("category", "")
-                if c["category"] not in old_cat:
-                    seen[sid]["category"] = old_cat + "," + c["category"]
+        seen = dedupe_by_sid(all_scraped)
 
-        new_entries = {sid: c for sid, c in seen.items() if sid not in existing_sids}
+        new_entries = {sid: c for sid, c in seen.items() if sid not in existing_by_sid}
         log.info(f"\nTotal on SSRN: {len(seen)} | New: {len(new_entries)}")
 
         if not new_entries:
             log.info("No new conferences found. JSON unchanged.")
-            browser.close()
+            await pool.close()
             return
 
         # Phase 2: Visit only NEW conference pages for deadlines
         log.info(f"\n=== Fetching deadlines for {len(new_entries)} new conferences ===")
-        deadlines_found = 0
-        for i, (sid, conf) in enumerate(new_entries.items()):
-            if (i + 1) % 10 == 0:
-                log.info(f"  Progress: {i+1}/{len(new_entries)}...")
-
-            deadline = scrape_deadline_from_page(page, conf["ssrnLink"])
-            if deadline:
-                conf["deadline"] = deadline
-                deadlines_found += 1
-                log.info(f"  Deadline: {conf['name'][:50]} -> {deadline}")
+        results = await scrape_detail_pages(
+            pool,
+            {sid: conf["ssrnLink"] for sid, conf in new_entries.items()},
+            {sid: conf.get("posted", "") for sid, conf in new_entries.items()},
+        )
+        await pool.close()
 
-        log.info(f"Found deadlines for {deadlines_found}/{len(new_entries)} new conferences")
-        browser.close()
+    deadlines_found = 0
+    for sid, conf in new_entries.items():
+        deadline = results[sid]["deadline"]
+        if deadline:
+            conf["deadline"] = deadline
+            deadlines_found += 1
+            log.info(f"  Deadline: {conf['name'][:50]} -> {deadline}")
+    log.info(f"Found deadlines for {deadlines_found}/{len(new_entries)} new conferences")
 
     # Phase 3: Merge new entries into existing
     log.info("\n=== Adding new conferences ===")
-    result = merge_scraped_into_existing(existing, list(new_entries.values()))
+    result = merge_scraped_into_existing(existing, new_entries.values(), existing_by_sid)
 
-    with open(JSON_PATH, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    save_existing_json(result)
 
-    dl_set = sum(1 for c in result if c.get("deadline") and c["deadline"] != "TBD")
-    tbd = sum(1 for c in result if not c.get("deadline") or c["deadline"] == "TBD")
+    dl_set, tbd, _ = count_statuses(result)
     log.info(f"\nSaved {len(result)} conferences to {JSON_PATH}")
     log.info(f"Deadlines set: {dl_set} | TBD: {tbd}")
 
 
-def run_list_only():
-    from playwright.sync_api import sync_playwright
+async def run_list_only():
+    from playwright.async_api import async_playwright
 
     existing = load_existing_json()
     existing_sids = {str(c.get("sid", "")) for c in existing}
     log.info(f"Loaded {len(existing)} existing conferences")
 
-    all_scraped = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        ctx = browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            viewport={"width": 1920, "height": 1080},
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-        page = ctx.new_page()
-        page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-
-        for name, nid in NETWORKS.items():
-            confs = scrape_listing_page(page, name, nid)
-            all_scraped.extend(confs)
-        browser.close()
+    async with async_playwright() as p:
+        pool = PagePool(await launch_context(p))
+        all_scraped = await scrape_listing_pages(pool)
+        await pool.close()
 
     seen = {}
     for c in all_scraped:
@@ -955,13 +1612,13 @@ def main():
 
     try:
         if args.new_only:
-            run_new_only()
+            asyncio.run(run_new_only())
         elif args.deadlines_only:
-            run_deadlines_only()
+            asyncio.run(run_deadlines_only())
         elif args.list_only:
-            run_list_only()
+            asyncio.run(run_list_only())
         else:
-            run_full_scrape()
+            asyncio.run(run_full_scrape())
     except ImportError:
         print("\n  Playwright not installed. Run:")
         print("    pip install playwright")
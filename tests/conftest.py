@@ -0,0 +1,22 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRAPER_PATH = Path(__file__).resolve().parent.parent / "ssrn_scraper.py"
+
+
+@pytest.fixture(scope="session")
+def scraper(tmp_path_factory, monkeypatch_session):
+    # Importing opens scrape_log.txt in the working directory; keep it out of the repo
+    monkeypatch_session.chdir(tmp_path_factory.mktemp("scrape"))
+    spec = importlib.util.spec_from_file_location("ssrn_scraper", SCRAPER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def monkeypatch_session():
+    with pytest.MonkeyPatch.context() as mp:
+        yield mp
@@ -0,0 +1,58 @@
+"""
+Date extraction from SSRN detail-page text.
+
+Run with:  python -m pytest tests
+"""
+
+import pytest
+
+
+# innerText keeps &nbsp; as U+00A0, which RE2's ASCII-only \s does not match
+@pytest.mark.parametrize("text, expected", [
+    ("Submission deadline: March\xa05, 2026", ("2026-03-05", (None, None))),
+    ("Submission deadline: March 5, 2026", ("2026-03-05", (None, None))),
+    ("Papers due by 15\u202fJanuary\u202f2027", ("2027-01-15", (None, None))),
+])
+def test_deadline_with_non_ascii_spaces(scraper, text, expected):
+    assert scraper.extract_dates_from_text(text) == expected
+
+
+def test_conference_date_with_nbsp(scraper):
+    deadline, (start, _) = scraper.extract_dates_from_text("Conference Date: 11\xa0July\xa02026")
+    assert deadline is None
+    assert start == "2026-07-11"
+
+
+@pytest.mark.parametrize("text", [
+    "Deadline\xa0for\xa0submissions is Friday,\xa0March\xa013,\xa02026",
+    "The conference will be held on\xa011\xa0July\xa02026. Papers due by 1 May 2026",
+    "Date:\xa03 Sept\xa02026\nclosing date 30\xa0June 2026",
+])
+def test_pattern_set_matches_full_scan(scraper, monkeypatch, text):
+    if scraper.DATE_PATTERN_SET is None:
+        pytest.skip("google-re2 not installed")
+    prefiltered = scraper.extract_dates_from_text(text)
+    monkeypatch.setattr(scraper, "DATE_PATTERN_SET", None)
+    assert prefiltered == scraper.extract_dates_from_text(text)
+    assert prefiltered[0] or prefiltered[1][0]
+
+
+DETAIL_HTML = """<html><body>
+<p>Date: 11 July 2026</p>
+<main><p>We invite submissions.</p><p>Submission deadline: March 5, 2026</p></main>
+</body></html>"""
+
+
+def test_date_block_outside_container_is_found(scraper):
+    text, page_text = scraper.html_to_texts(DETAIL_HTML)
+    assert "Date:" not in text and "Date:" in page_text
+    assert scraper.extract_dates_from_text(text)[1] == (None, None)
+    deadline, (start, _) = scraper.extract_detail_dates(text, page_text)
+    assert deadline == "2026-03-05"
+    assert start == "2026-07-11"
+
+
+def test_container_dates_take_priority(scraper):
+    text = "Submission deadline: March 5, 2026\nConference Date: 11 July 2026"
+    page_text = "Deadline: January 1, 2027\n" + text
+    assert scraper.extract_detail_dates(text, page_text)[0] == "2026-03-05"
@@ -0,0 +1,49 @@
+"""
+The detail-page cache in front of scrape_detail_pages.
+
+Run with:  python -m pytest tests
+"""
+
+import asyncio
+from datetime import date
+
+
+class FakePool:
+    """Stands in for PagePool; the pages are never used because scrape_detail_page is replaced."""
+
+    ctx = None
+
+    async def acquire(self):
+        return object()
+
+    def release(self, page):
+        pass
+
+
+def cache_entry(deadline):
+    return {"fetched": date.today().isoformat(), "posted": "", "deadline": deadline,
+            "conf_date": ["2026-07-11", "Jul 11"]}
+
+
+def test_cached_detail_skips_entries_without_deadline(scraper):
+    assert scraper.cached_detail(cache_entry(None), "") is None
+    assert scraper.cached_detail(cache_entry("2026-03-05"), "")["deadline"] == "2026-03-05"
+
+
+def test_no_deadline_entry_is_fetched_again(scraper, monkeypatch, tmp_path):
+    monkeypatch.setattr(scraper, "DETAIL_CACHE_PATH", tmp_path / "cache.json")
+    monkeypatch.setattr(scraper, "httpx", None)
+    scraper.save_detail_cache({"1": cache_entry(None), "2": cache_entry("2026-03-05")})
+
+    visited = []
+
+    async def scrape_detail_page(page, url):
+        visited.append(url)
+        return {"deadline": "2026-04-01", "conf_date": (None, None), "loaded": True}
+
+    monkeypatch.setattr(scraper, "scrape_detail_page", scrape_detail_page)
+    results = asyncio.run(scraper.scrape_detail_pages(FakePool(), {"1": "url-1", "2": "url-2"}))
+
+    assert visited == ["url-1"]
+    assert results["1"]["deadline"] == "2026-04-01"
+    assert results["2"]["deadline"] == "2026-03-05"